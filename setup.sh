@@ -81,9 +81,13 @@ Main server implementation for Meep Research MCP
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from contextlib import asynccontextmanager
+from collections import OrderedDict
 from collections.abc import AsyncIterator
+import asyncio
+import logging
+import time
 
 from mcp.server.fastmcp import FastMCP, Context
 
@@ -109,6 +113,54 @@ mcp = FastMCP(
     dependencies=["asyncio", "aiohttp"]
 )
 
+# Google results are stable for much longer than a research session, and every
+# API call costs quota, so repeated queries are answered from memory
+SEARCH_CACHE_TTL_SECONDS = 3600
+SEARCH_CACHE_MAX_ENTRIES = 4096
+# Results are stored as tuples; callers get their own list so they can't alter the cache
+_search_cache: "OrderedDict[str, Tuple[float, Tuple[Dict[str, Any], ...]]]" = OrderedDict()
+# Searches currently waiting on Google, so concurrent identical queries share one call
+_inflight_searches: Dict[str, "asyncio.Task[Tuple[Dict[str, Any], ...]]"] = {}
+
+async def _fetch_and_cache(key: str, google_query: str) -> Tuple[Dict[str, Any], ...]:
+    """Run one Google search and store its results under key"""
+    try:
+        results = tuple(await search_google_custom(google_query))
+        _search_cache[key] = (time.monotonic(), results)
+        if len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+            _search_cache.popitem(last=False)
+        return results
+    finally:
+        _inflight_searches.pop(key, None)
+
+async def cached_search(google_query: str) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Search Google Custom Search, reusing recent or in-flight results for the same query.
+    
+    Returns:
+        The results and whether they were served without a new API call
+    """
+    # Collapse whitespace only; case matters for operators like OR
+    key = ' '.join(google_query.split())
+    entry = _search_cache.get(key)
+    if entry is not None:
+        stored_at, results = entry
+        if time.monotonic() - stored_at < SEARCH_CACHE_TTL_SECONDS:
+            _search_cache.move_to_end(key)
+            return list(results), True
+        del _search_cache[key]
+    
+    # Shield the shared task so one caller being cancelled doesn't cancel the others
+    task = _inflight_searches.get(key)
+    if task is not None:
+        return list(await asyncio.shield(task)), True
+    task = asyncio.ensure_future(_fetch_and_cache(key, google_query))
+    # If every caller was cancelled nobody awaits the task; retrieve its outcome
+    # so a failure isn't reported as "Task exception was never retrieved"
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    _inflight_searches[key] = task
+    return list(await asyncio.shield(task)), False
+
 @mcp.tool()
 async def search_with_operators(
     query: str,
@@ -127,6 +179,10 @@ async def search_with_operators(
     """
     logger.info(f"Handling search: {query} (type: {search_type})")
     
+    # Nothing to search for; don't spend quota or pollute the cache
+    if not query.strip():
+        return _search_error_response(query, query, "Search query is empty")
+    
     try:
         # Generate operators based on search_type
         enhanced_query = build_advanced_query(query, search_type)
@@ -135,7 +191,7 @@ async def search_with_operators(
         google_query = validate_and_convert_query(enhanced_query)
         
         # Perform search using Google Custom Search (uses max_results from config)
-        results = await search_google_custom(google_query)
+        results, cached = await cached_search(google_query)
         
         # Get API status for monitoring
         api_status = get_api_status()
@@ -145,6 +201,7 @@ async def search_with_operators(
             "enhanced_query": enhanced_query,
             "converted_query": google_query,
             "engine": "google_custom_search",
+            "cached": cached,
             "api_status": api_status
         }
         
@@ -156,30 +213,32 @@ async def search_with_operators(
         except:
             enhanced_query = query
             
-        return {
-            "results": [],
-            "enhanced_query": enhanced_query,
-            "converted_query": query,
-            "engine": "google_custom_search",
-            "error": str(e),
-            "api_status": get_api_status()
-        }
+        return _search_error_response(enhanced_query, query, str(e))
+
+def _search_error_response(enhanced_query: str, converted_query: str, error: str) -> Dict[str, Any]:
+    """Build a search_with_operators response for a search that returned no results"""
+    return {
+        "results": [],
+        "enhanced_query": enhanced_query,
+        "converted_query": converted_query,
+        "engine": "google_custom_search",
+        "cached": False,
+        "error": error,
+        "api_status": get_api_status()
+    }
+
+# Operators appended to the query for each search type; other types (general)
+# search with the query as-is
+_SEARCH_TEMPLATES = {
+    "academic": " site:scholar.google.com OR site:arxiv.org OR site:researchgate.net OR filetype:pdf",
+    "news": " site:reuters.com OR site:bbc.com OR site:ap.org OR site:npr.org",
+    "technical": " site:stackoverflow.com OR site:github.com OR site:docs.python.org OR site:developer.mozilla.org",
+    "osint": " -site:facebook.com -site:twitter.com -site:instagram.com",
+}
 
 def build_advanced_query(query: str, search_type: str) -> str:
     """Build advanced search query with operators based on search type"""
-    
-    # Enhanced query building for Google Custom Search
-    if search_type == "academic":
-        return f'{query} site:scholar.google.com OR site:arxiv.org OR site:researchgate.net OR filetype:pdf'
-    elif search_type == "news":
-        return f'{query} site:reuters.com OR site:bbc.com OR site:ap.org OR site:npr.org'
-    elif search_type == "technical":
-        return f'{query} site:stackoverflow.com OR site:github.com OR site:docs.python.org OR site:developer.mozilla.org'
-    elif search_type == "osint":
-        return f'{query} -site:facebook.com -site:twitter.com -site:instagram.com'
-    else:
-        # General search with basic enhancement
-        return query
+    return query + _SEARCH_TEMPLATES.get(search_type, "")
 
 def main():
     """Run the server directly"""
@@ -209,14 +268,30 @@ Converts natural language research requests into precise Google search operators
 Designed for MCP integration with focus on user-controlled source restrictions.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Maximum number of distinct (request, source_restrictions) translations kept in memory
+TRANSLATION_CACHE_SIZE = 512
+
+# Entity extraction: quoted phrases, and runs of capitalized words
+_QUOTED_RE = re.compile(r'"([^"]*)"')
+# Names don't span line breaks, so words are only joined by spaces and tabs
+_PROPER_NOUN_RE = re.compile(r'\b[A-Z]\w+(?:[ \t]+[A-Z]\w+)*')
+# Capitalized words that open a request without being part of a name
+_SENTENCE_STARTERS = frozenset({
+    'An', 'The', 'This', 'These', 'Those',
+    'Find', 'Search', 'Show', 'Get', 'Look', 'List', 'Compare', 'Research', 'Investigate',
+    'What', 'Who', 'Whom', 'Whose', 'Where', 'When', 'Why', 'How', 'Which',
+    'Is', 'Are', 'Was', 'Were', 'Do', 'Does', 'Did', 'Can', 'Could', 'Should',
+})
+
+@dataclass(slots=True)
 class SearchQuery:
     """Simple container for a search query and its purpose"""
     query: str
@@ -228,65 +303,55 @@ class QueryTranslator:
     Simple translator that converts natural language research requests 
     into precise Google search operators with user-specified restrictions.
     """
-    
-    def __init__(self):
-        # Core Google operators
-        self.operators = {
-            'exact_phrase': lambda text: f'"{text}"',
-            'site_restrict': lambda domain: f'site:{domain}',
-            'exclude_site': lambda domain: f'-site:{domain}',
-            'filetype': lambda ext: f'filetype:{ext}',
-            'intitle': lambda text: f'intitle:"{text}"',
-            'inurl': lambda text: f'inurl:{text}',
-            'intext': lambda text: f'intext:"{text}"',
-            'proximity': lambda term1, term2, distance: f'"{term1}" AROUND({distance}) "{term2}"',
-            'date_after': lambda date: f'after:{date}',
-            'date_before': lambda date: f'before:{date}',
-            'exclude_term': lambda term: f'-{term}',
-            'wildcard': lambda phrase: f'"{phrase}"',
-            'or_operator': lambda terms: f'({" OR ".join(terms)})',
-            'and_operator': lambda terms: f'{" ".join(terms)}'
-        }
-        
-        # Common patterns in research requests
-        self.patterns = {
-            'proximity_request': re.compile(r'(.*?)\s+(mentioned|described|discussed|appear)\s+(close|together|near)\s+(.*?)'),
-            'site_restriction': re.compile(r'(on|in|from)\s+([\w\.-]+\.\w+)'),
-            'content_location': re.compile(r'in\s+(title|url|text|paragraphs?)'),
-            'exclusion_request': re.compile(r'(but not|exclude|without|except)\s+(.*?)'),
-            'time_restriction': re.compile(r'(after|since|before|until)\s+(\d{4}(?:/\d{1,2}(?:/\d{1,2})?)?)')
-        }
 
-    def translate_request(self, request: str, source_restrictions: Optional[str] = None) -> SearchQuery:
-        """Main method: translate natural language request into Google search operators."""
+    def translate_request(self, request: str, source_restrictions: Optional[str] = None,
+                          include_breakdown: bool = False) -> SearchQuery:
+        """
+        Main method: translate natural language request into Google search operators.
+        
+        The operator breakdown is only filled in when include_breakdown is set,
+        since most callers just pass the query on to the search API.
+        """
+        query, purpose, breakdown = _translate_cached(type(self), request, source_restrictions, include_breakdown)
+        # Give each caller its own breakdown so cached entries can't be mutated
+        return SearchQuery(
+            query=query,
+            purpose=purpose,
+            operator_breakdown={key: list(value) if isinstance(value, tuple) else value
+                                for key, value in breakdown}
+        )
+
+    def _translate(self, request: str, source_restrictions: Optional[str] = None,
+                   include_breakdown: bool = False) -> SearchQuery:
+        """Uncached translation backing translate_request."""
         try:
             # Clean and prepare the request
             request = request.strip()
             operator_breakdown = {}
-            query_parts = []
             
-            # Add user-specified source restrictions first (highest priority)
-            if source_restrictions:
-                query_parts.append(source_restrictions)
+            if source_restrictions and include_breakdown:
                 operator_breakdown['source_restrictions'] = source_restrictions
             
             # Extract entities and create query
             entities = self._extract_entities(request)
             if entities:
                 query = ' '.join(f'"{entity}"' for entity in entities)
-                query_parts.append(query)
-                operator_breakdown['entities'] = entities
+                if include_breakdown:
+                    operator_breakdown['entities'] = entities
             else:
                 # FIXED: Proper fallback if no entities found
-                query_parts.append(request)
-                operator_breakdown['fallback'] = "Used original request due to no entities found"
+                query = request
+                if include_breakdown:
+                    operator_breakdown['fallback'] = "Used original request due to no entities found"
             
-            final_query = ' '.join(query_parts)
+            # User-specified source restrictions go first (highest priority)
+            final_query = f'{source_restrictions} {query}' if source_restrictions else query
             
             # FIXED: Another fallback check
             if not final_query.strip():
                 final_query = request
-                operator_breakdown['fallback'] = "Used original request due to empty translation"
+                if include_breakdown:
+                    operator_breakdown['fallback'] = "Used original request due to empty translation"
             
             return SearchQuery(
                 query=final_query,
@@ -301,6 +366,67 @@ class QueryTranslator:
                 purpose=f"Fallback query: {request[:100]}",
                 operator_breakdown={"error": str(e), "fallback": "Translation failed"}
             )
+
+    def _extract_entities(self, request: str) -> List[str]:
+        """
+        Extract quoted phrases and capitalized names from the request.
+        
+        >>> QueryTranslator()._extract_entities('research "Climate Change" by Greta Thunberg')
+        ['Climate Change', 'Greta Thunberg']
+        >>> QueryTranslator()._extract_entities('Reports about "New York Times" coverage')
+        ['New York Times']
+        >>> QueryTranslator()._extract_entities('Elon Musk interviews about Tesla')
+        ['Elon Musk', 'Tesla']
+        >>> QueryTranslator()._extract_entities('Acme Corp filings')
+        ['Acme Corp']
+        >>> QueryTranslator()._extract_entities('Find filings by Acme Corp')
+        ['Acme Corp']
+        >>> QueryTranslator()._extract_entities('Find Acme Corp filings')
+        ['Acme Corp']
+        >>> QueryTranslator()._extract_entities('What Elon Musk said about Tesla')
+        ['Elon Musk', 'Tesla']
+        >>> QueryTranslator()._extract_entities('The United Nations report')
+        ['United Nations']
+        >>> QueryTranslator()._extract_entities('Reports on Tesla\\\\nElon Musk')
+        ['Tesla', 'Elon Musk']
+        """
+        entities = _QUOTED_RE.findall(request)
+        # Blank out quoted phrases so their words aren't picked up a second time
+        for match in _PROPER_NOUN_RE.finditer(_QUOTED_RE.sub(' ', request)):
+            name = match.group()
+            if match.start() == 0:
+                first, *rest = name.split(None, 1)
+                # A lone capitalized first word is usually just the start of the sentence
+                if not rest:
+                    continue
+                if first in _SENTENCE_STARTERS:
+                    name = rest[0]
+            entities.append(name)
+        # dict.fromkeys dedupes in one pass while keeping first-seen order
+        return [entity for entity in dict.fromkeys(entities)
+                if len(entity) > 1 and not entity.isspace()]
+
+    def _generate_purpose(self, request: str) -> str:
+        """Describe the query's purpose, truncating long requests"""
+        # Only slice when needed; short requests are used as-is without a copy
+        return f"Research query: {request if len(request) <= 100 else request[:100] + '...'}"
+
+@lru_cache(maxsize=TRANSLATION_CACHE_SIZE)
+def _translate_cached(translator_cls: type, request: str, source_restrictions: Optional[str],
+                      include_breakdown: bool) -> Tuple[str, str, Tuple[Tuple[str, Any], ...]]:
+    """
+    Memoize translations across MCP calls, stored in immutable form.
+    
+    Translators hold no per-instance state, so the cache is keyed on the
+    class: throwaway instances share entries, and subclasses that override
+    translation steps get their own.
+    """
+    result = translator_cls()._translate(request, source_restrictions, include_breakdown)
+    breakdown = tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in result.operator_breakdown.items()
+    )
+    return result.query, result.purpose, breakdown
 EOF
 
             cat > meep_research_mcp/google_search.py << EOF
@@ -308,11 +434,9 @@ EOF
 Google Custom Search API implementation for Meep Research MCP
 """
 from typing import Dict, List, Any, Optional
-from urllib.parse import quote_plus
-from datetime import datetime, timedelta
+from collections import deque
 import logging
 import time
-import aiohttp
 
 try:
     from .config import get_config, ConfigError
@@ -332,6 +456,9 @@ class GoogleCustomSearchError(Exception):
 class GoogleSearchRateLimiter:
     """Rate limiter for Google Custom Search API"""
     
+    __slots__ = ("max_requests_per_day", "max_requests_per_minute",
+                 "daily_count", "minute_requests", "last_reset")
+    
     def __init__(self, config=None):
         if config is None:
             try:
@@ -348,28 +475,32 @@ class GoogleSearchRateLimiter:
             self.max_requests_per_minute = config.max_requests_per_minute
             
         self.daily_count = 0
-        self.minute_requests = []
-        self.last_reset = time.time()
+        # Request timestamps in insertion order, so the oldest is always at the left
+        self.minute_requests = deque()
+        # Intervals use the monotonic clock so wall-clock adjustments can't
+        # expire or extend the windows
+        self.last_reset = time.monotonic()
 
     def can_make_request(self) -> bool:
         """Check if we can make a request within rate limits"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Reset daily counter if it's a new day
         if current_time - self.last_reset > 86400:  # 24 hours
             self.daily_count = 0
             self.last_reset = current_time
             
-        # Clean old minute requests
-        self.minute_requests = [req_time for req_time in self.minute_requests 
-                               if current_time - req_time < 60]
+        # Drop expired minute requests from the front of the window
+        minute_requests = self.minute_requests
+        while minute_requests and current_time - minute_requests[0] >= 60:
+            minute_requests.popleft()
         
         return (self.daily_count < self.max_requests_per_day and 
                 len(self.minute_requests) < self.max_requests_per_minute)
 
     def record_request(self):
         """Record that a request was made"""
-        current_time = time.time()
+        current_time = time.monotonic()
         self.daily_count += 1
         self.minute_requests.append(current_time)
 
@@ -396,21 +527,18 @@ def get_reset_time() -> str:
     """Get human readable time until rate limit resets"""
     try:
         limiter = get_rate_limiter()
-        current_time = time.time()
         
-        # Check daily reset (resets at midnight UTC)
+        # Check daily reset (24 hours after the limiter's last reset)
         if limiter.daily_count >= limiter.max_requests_per_day:
-            tomorrow = datetime.fromtimestamp(current_time) + timedelta(days=1)
-            midnight = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
-            seconds_until_reset = (midnight.timestamp() - current_time)
-            hours = int(seconds_until_reset // 3600)
-            minutes = int((seconds_until_reset % 3600) // 60)
-            return f"{hours}h {minutes}m"
+            elapsed = time.monotonic() - limiter.last_reset
+            seconds_until_reset = max(0, int(86400 - elapsed))
+            hours, remainder = divmod(seconds_until_reset, 3600)
+            return f"{hours}h {remainder // 60}m"
         
         # Check minute reset
         if len(limiter.minute_requests) >= limiter.max_requests_per_minute:
-            oldest_request = min(limiter.minute_requests)
-            seconds_until_reset = 60 - (current_time - oldest_request)
+            oldest_request = limiter.minute_requests[0]
+            seconds_until_reset = 60 - (time.monotonic() - oldest_request)
             return f"{int(seconds_until_reset)}s"
         
         return "now"
@@ -434,7 +562,6 @@ Command-line entry point for Meep Research MCP.
 
 import argparse
 import logging
-from .server import mcp
 
 def main():
     """Main entry point for the package."""
@@ -455,6 +582,10 @@ def main():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
+    # Import the server only once arguments are valid, so --help and usage
+    # errors don't pay for loading the MCP framework and HTTP stack
+    from .server import mcp
+    
     # Start the server
     print(f"Starting Meep Research MCP Server using {args.transport} transport")
     print("Press Ctrl+C to stop the server")